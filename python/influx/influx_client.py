@@ -3,10 +3,12 @@
 Classes:
     InfluxClient
 """
+import gzip
 import logging
 import re
 import time
-from typing import Any, Dict, List, Optional, Tuple, Union
+from concurrent.futures import Future, ThreadPoolExecutor, as_completed
+from typing import Any, Dict, Iterator, List, Optional, Tuple, Union
 
 import requests
 from influxdb import InfluxDBClient
@@ -28,6 +30,7 @@ class InfluxClient:
 
     Attributes:
         database - database with predefined tables
+        time_precision - precision of all timestamps sent to or queried from the influxdb
 
     Methods:
         connect - connects the client to remote sever
@@ -48,11 +51,35 @@ class InfluxClient:
         """Database with predef tables. Access by [tablename] to gain instance"""
         return self.__database
 
-    __insert_buffer: Dict[Table, List[InsertQuery]] = {}
-    """used to send all insert-querys at once. Multiple Insert-Querys per table"""
+    time_precision: str = 's'
+    """Precision of all timestamps sent to or queried from the influxdb. `InsertQuery` saves any timestamp in seconds."""
 
-    __query_max_batch_size = 10000
-    """Maximum amount of querys sent at once to the influxdb. Recommended is 5000-10000."""
+    __query_max_batch_size = 5000
+    """Maximum amount of querys sent at once to the influxdb. Recommended is 5000."""
+
+    __query_max_batch_bytes = 10 * 1024 * 1024
+    """Maximum size of querys sent at once to the influxdb, whichever limit is reached first. Recommended is 10 MB."""
+
+    __gzip_compress_level = 1
+    """Compression level of inserts. Level 1 saves most of the size at a fraction of the cpu time of level 9."""
+
+    __max_send_workers = 8
+    """Maximum amount of tables sent concurrently to the influxdb when flushing the buffer."""
+
+    __max_transfer_workers = 4
+    """Maximum amount of `SELECT INTO` queries sent concurrently by `transfer_data`."""
+
+    __insert_buffer_max_size = 50000
+    """Maximum amount of querys buffered per table before the buffer is flushed to avoid a memoryError."""
+
+    __from_clause_pattern = re.compile(r"(FROM ((.+)\.(.+)\..+) GROUP BY)")
+    """Matches the FROM clause of a CQ select query, used by `transfer_data`."""
+
+    __critical_drop_pattern = re.compile(r"partial write: points beyond retention policy dropped=10000")
+    """Matches a partial write which dropped a whole batch, used by `transfer_data`."""
+
+    __drop_pattern = re.compile(r"partial write: points beyond retention policy dropped=")
+    """Matches any partial write due the retention policy, used by `transfer_data`."""
 
     def __init__(self, auth_influx: Dict[str, Any]):
         """Initalize the influx client from a config dict. Call `connect` before using the client.
@@ -63,6 +90,10 @@ class InfluxClient:
         Raises:
             ValueError: Raises a ValueError if any important parameters are missing within the file
         """
+        # per instance, a class attribute would be shared by all clients
+        self.__insert_buffer: Dict[Table, List[str]] = {}
+        """used to send all insert-querys at once. Multiple Insert-Querys per table, already computed into str."""
+
         try:
             self.__user: str = auth_influx["username"]
             self.__password: str = auth_influx["password"]
@@ -86,6 +117,7 @@ class InfluxClient:
 
         # declare for later
         self.__client: InfluxDBClient
+        self.__send_executor: Optional[ThreadPoolExecutor] = None
 
     def connect(self) -> None:
         """Connect client to remote server. Call this before using any other methods.
@@ -101,7 +133,9 @@ class InfluxClient:
                 password=self.__password,
                 ssl=self.__use_ssl,
                 verify_ssl=self.__verify_ssl,
-                timeout=20
+                timeout=20,
+                # larger pool to keep connections alive for concurrent sends
+                pool_size=64
             )
 
             # ping to make sure connection works
@@ -115,6 +149,12 @@ class InfluxClient:
             self.check_create_rp()
             self.check_create_cq()
 
+            # kept for the whole connection, overlaps sending of tables with transforming the next ones
+            # created last to not leak it on a failed login, a reconnect replaces the old one
+            if(self.__send_executor is not None):
+                self.__send_executor.shutdown()
+            self.__send_executor = ThreadPoolExecutor(max_workers=self.__max_send_workers)
+
         except (ValueError, InfluxDBClientError, InfluxDBServerError, requests.exceptions.ConnectionError) as error: # type: ignore
             ExceptionUtils.exception_info(error=error) # type: ignore
             raise ValueError("Login into influxdb failed")
@@ -123,14 +163,17 @@ class InfluxClient:
         """Disconnects client from remote server and finally flushes buffer."""
         LOGGER.debug("disconnecting Influx database")
 
-        # Double send to make sure all metrics are send
         try:
             self.flush_insert_buffer()
-            self.flush_insert_buffer()
+            # only the send-statistics of the first flush remain, no need to collect new ones
+            self.__flush_insert_buffer(collect_metrics=False)
         except ValueError as error:
             ExceptionUtils.exception_info(
                 error=error,
                 extra_message="Failed to flush buffer on logout, possible data loss")
+        if(self.__send_executor is not None):
+            self.__send_executor.shutdown()
+            self.__send_executor = None
         self.__client.close()
 
 
@@ -148,23 +191,23 @@ class InfluxClient:
             for result in results:
                 rp_dict[result['name']] = result
 
-            add_rp_list: List[RetentionPolicy] = []
-            alter_rp_list: List[RetentionPolicy] = []
-            default_used = False
-
-            for retention_policy in self.database.retention_policies:
-                # make sure only one RP is default
-                if(retention_policy.default):
-                    if(default_used):
-                        raise ValueError("multiple Retention Policies are declared as default")
-                    default_used = True
-
-                result_rp = rp_dict.get(retention_policy.name, None)
-                if(result_rp is None):
-                    add_rp_list.append(retention_policy)
-                elif(result_rp != retention_policy.to_dict()):
-                    alter_rp_list.append(retention_policy)
-                # else: all good
+            # make sure only one RP is default
+            if(len([rp for rp in self.database.retention_policies if rp.default]) > 1):
+                raise ValueError("multiple Retention Policies are declared as default")
+
+            # compute each dict once, then diff both by name
+            desired_rp_dict: Dict[str, Dict[str, Any]] = {
+                rp.name: rp.to_dict() for rp in self.database.retention_policies}
+            add_names = desired_rp_dict.keys() - rp_dict.keys()
+            alter_names = {name for name in desired_rp_dict.keys() & rp_dict.keys()
+                           if desired_rp_dict[name] != rp_dict[name]}
+            # else: all good
+
+            add_rp_list: List[RetentionPolicy] = [
+                rp for rp in self.database.retention_policies if rp.name in add_names]
+            alter_rp_list: List[RetentionPolicy] = [
+                rp for rp in self.database.retention_policies if rp.name in alter_names]
+
             LOGGER.debug(f"missing {len(add_rp_list)} RP's. Adding {add_rp_list}")
             for retention_policy in add_rp_list:
                 self.__client.create_retention_policy( # type: ignore
@@ -175,7 +218,7 @@ class InfluxClient:
                     default=retention_policy.default,
                     shard_duration=retention_policy.shard_duration
                 )
-            LOGGER.debug(f"altering {len(add_rp_list)} RP's. altering {add_rp_list}")
+            LOGGER.debug(f"altering {len(alter_rp_list)} RP's. altering {alter_rp_list}")
             for retention_policy in alter_rp_list:
                 self.__client.alter_retention_policy( # type: ignore
                     name=retention_policy.name,
@@ -208,23 +251,24 @@ class InfluxClient:
             if(cq_result_list is None):
                 cq_result_list = []
 
-            cq_dict: Dict[str, ContinuousQuery] = {}
+            cq_dict: Dict[str, str] = {}
             for cq_result in cq_result_list:
                 cq_dict[cq_result['name']] = cq_result['query']
 
-            add_cq_list: List[ContinuousQuery] = []
-            alter_cq_list: List[ContinuousQuery] = []
+            # compute each query once, then diff both by name
+            desired_cq_dict: Dict[str, str] = {
+                cq.name: cq.to_query() for cq in self.database.continuous_queries}
+            add_names = desired_cq_dict.keys() - cq_dict.keys()
+            alter_names = {name for name in desired_cq_dict.keys() & cq_dict.keys()
+                           if desired_cq_dict[name] != cq_dict[name]}
+            # else: all good
 
-            for continuous_query in self.database.continuous_queries:
+            add_cq_list: List[ContinuousQuery] = [
+                cq for cq in self.database.continuous_queries if cq.name in add_names]
+            alter_cq_list: List[ContinuousQuery] = [
+                cq for cq in self.database.continuous_queries if cq.name in alter_names]
 
-                result_cq = cq_dict.get(continuous_query.name, None)
-                if(result_cq is None):
-                    add_cq_list.append(continuous_query)
-                elif(result_cq != continuous_query.to_query()):
-                    alter_cq_list.append(continuous_query)
-                # else: all good
-
-            LOGGER.debug(f"altering {len(add_cq_list)} CQ's. deleting {add_cq_list}")
+            LOGGER.debug(f"altering {len(alter_cq_list)} CQ's. deleting {alter_cq_list}")
             # alter not possible -> drop and readd
             for continuous_query in alter_cq_list:
                 self.__client.drop_continuous_query(  # type: ignore
@@ -269,7 +313,7 @@ class InfluxClient:
 
                 # replacing the rp of the string is easier then everything else
 
-                match = re.search(r"(FROM ((.+)\.(.+)\..+) GROUP BY)", query_str)
+                match = self.__from_clause_pattern.search(query_str)
                 if(not match):
                     raise ValueError("error when matching")
 
@@ -286,7 +330,7 @@ class InfluxClient:
                     continue
                 if(con_query.select_query.into_table.retention_policy.duration != '0s'):
                     # add where clause to prevent dataloss due overflowing retention drop.
-                    if(re.search("WHERE", new_f_q_t)):
+                    if("WHERE" in new_f_q_t):
                         new_f_q_t += " AND "
                     else:
                         new_f_q_t += " WHERE "
@@ -308,64 +352,57 @@ class InfluxClient:
         critical_drop: int = 0
         LOGGER.info("starting transfer of data")
 
-        # disable timeout
+        # disable timeout, the client and its connections are reused
         old_timeout = self.__client._timeout
-        self.__client = InfluxDBClient( # type: ignore
-            host=self.__address,
-            port=self.__port,
-            username=self.__user,
-            password=self.__password,
-            ssl=self.__use_ssl,
-            verify_ssl=self.__verify_ssl,
-            timeout=7200
-        )
-        # ping to make sure connection works
-        version: str = self.__client.ping()
-        LOGGER.info(f"Connected again to influxdb with new timeout of {self.__client._timeout}, version: {version}")
+        self.__client._timeout = 7200
+        LOGGER.info(f"Using a new timeout of {self.__client._timeout} for the transfer")
         i = 0
 
-        for query in queries:
-            try:
-                start_time = time.perf_counter()
-                # seems like you may only send one SELECT INTO at once via python
-                result = self.__client.query( # type: ignore
-                    query=query, epoch='s', database=self.database.name)
-                end_time = time.perf_counter()
-
-                # count lines written, max 1
-                for result in result.get_points():
-                    i += 1
-                    line_count += result["written"]
-                    LOGGER.info(f'query {i}/{len(queries)}: {result["written"]} lines in {end_time-start_time}')
-
-            except InfluxDBClientError as error:
-                # only raise if the error is unexpected
-                if(re.search(f"partial write: points beyond retention policy dropped=10000", error.content)):
-                    critical_drop += 1
-                    raise ValueError("transfer of data failed, retry manually with a shorter WHERE-clause", query)
-                if(re.search(f"partial write: points beyond retention policy dropped=", error.content)):
-                    dropped_count += 1
-                else:
-                    ExceptionUtils.exception_info(error=error, extra_message=f"transfer of data failed for query {query}")
-                    critical_drop += 1
-
-            except (InfluxDBServerError, requests.exceptions.ConnectionError) as error:
-                ExceptionUtils.exception_info(error=error, extra_message=f"transfer of data failed for query {query}")
-                critical_drop += 1
-
-        # reset timeout
-        self.__client = InfluxDBClient( # type: ignore
-            host=self.__address,
-            port=self.__port,
-            username=self.__user,
-            password=self.__password,
-            ssl=self.__use_ssl,
-            verify_ssl=self.__verify_ssl,
-            timeout=old_timeout
-        )
-        # ping to make sure connection works
-        version: str = self.__client.ping()
-        LOGGER.info(f"Connected again to influxdb with old timeout of {self.__client._timeout}, version: {version}")
+        try:
+            # queries are independent, send a few at once to keep the server load bounded
+            with ThreadPoolExecutor(max_workers=self.__max_transfer_workers) as executor:
+                future_list: List[Tuple[str, Future[Tuple[ResultSet, float]]]] = [
+                    (query, executor.submit(self.__send_transfer_query, query)) for query in queries]
+
+                for (query, future) in future_list:
+                    try:
+                        (result, duration_s) = future.result()
+
+                        # count lines written, max 1
+                        # read from raw, `get_points()` would build a dict for each row
+                        if(result):
+                            try:
+                                series = result.raw['series'][0] # type: ignore
+                                written: int = series['values'][0][series['columns'].index('written')] # type: ignore
+                            except (KeyError, IndexError, ValueError):
+                                # unexpected result, the data is transfered but lines can't be counted
+                                dropped_count += 1
+                                continue
+                            i += 1
+                            line_count += written
+                            LOGGER.info(f'query {i}/{len(queries)}: {written} lines in {duration_s}')
+
+                    except InfluxDBClientError as error:
+                        # only raise if the error is unexpected
+                        if(self.__critical_drop_pattern.search(error.content)):
+                            critical_drop += 1
+                            # do not start any queries not yet sent
+                            for (_, pending_future) in future_list:
+                                pending_future.cancel()
+                            raise ValueError("transfer of data failed, retry manually with a shorter WHERE-clause", query)
+                        if(self.__drop_pattern.search(error.content)):
+                            dropped_count += 1
+                        else:
+                            ExceptionUtils.exception_info(error=error, extra_message=f"transfer of data failed for query {query}")
+                            critical_drop += 1
+
+                    except (InfluxDBServerError, requests.exceptions.ConnectionError) as error:
+                        ExceptionUtils.exception_info(error=error, extra_message=f"transfer of data failed for query {query}")
+                        critical_drop += 1
+        finally:
+            # reset timeout
+            self.__client._timeout = old_timeout
+            LOGGER.info(f"Reset the timeout to {self.__client._timeout}")
 
 
         LOGGER.info("transfer of data sucessfully")
@@ -380,6 +417,24 @@ class InfluxClient:
                 "if it reaches 10.000 you need to cut the query into smaller bits.")
 
 
+    def __send_transfer_query(self, query: str) -> Tuple[ResultSet, float]: # type: ignore
+        """Sends a single `SELECT INTO` query of `transfer_data`, used concurrently.
+
+        Arguments:
+            query {str} -- query to be sent
+
+        Returns:
+            Tuple[ResultSet, float] -- result of the query and duration of the send in seconds
+        """
+        start_time = time.perf_counter()
+        # only one SELECT INTO per request, the python client does not support multiple statements in a single query.
+        # Separate requests do not share this limit, therefore they are sent concurrently.
+        result: ResultSet = self.__client.query( # type: ignore
+            query=query, epoch=self.time_precision, database=self.database.name)
+        end_time = time.perf_counter()
+
+        return (result, end_time-start_time) # type: ignore
+
     def insert_dicts_to_buffer(self, table_name: str, list_with_dicts: List[Dict[str, Any]]) -> None:
         """Insert a list of dicts with data into influxdb. Splits according to table definition.
 
@@ -408,8 +463,8 @@ class InfluxClient:
         # get table instance
         table = self.database[table_name]
 
-        # Generate querys for each dict
-        query_buffer = []
+        # Generate querys for each dict, computed into str right away
+        query_buffer: List[str] = []
         for mydict in list_with_dicts:
             try:
                 # split dict according to default tables
@@ -420,7 +475,7 @@ class InfluxClient:
                 # LOGGER.debug("%d %s %s %d",appendCount,tags,values,timestamp)
 
                 # create query and append to query_buffer
-                query_buffer.append(InsertQuery(table, values, tags, timestamp))
+                query_buffer.append(InsertQuery(table, values, tags, timestamp).to_query())
             except ValueError as err:
                 ExceptionUtils.exception_info(error=err, extra_message="skipping single dict to insert")
                 continue
@@ -432,7 +487,7 @@ class InfluxClient:
         LOGGER.debug("Appended %d items to the insert buffer", len(query_buffer))
 
         # safeguard to avoid memoryError
-        if(len(self.__insert_buffer[table]) > 5 * self.__query_max_batch_size):
+        if(len(self.__insert_buffer[table]) > self.__insert_buffer_max_size):
             self.flush_insert_buffer()
         
         LOGGER.debug(f"Exit insert_dicts for table: {table_name}")
@@ -440,48 +495,118 @@ class InfluxClient:
     def flush_insert_buffer(self) -> None:
         """Flushes the insert buffer, send querys to influxdb server.
 
-        Sends in batches defined by `__batch_size` to reduce http overhead.
+        Sends in batches defined by `__query_max_batch_size` and `__query_max_batch_bytes` to reduce http overhead.
+        Tables are sent concurrently, at most `__max_send_workers` at once.
         Only send-statistics remain in buffer, flush again to send those too.
 
         Raises:
             ValueError: Critical: The query Buffer is None.
         """
+        self.__flush_insert_buffer(collect_metrics=True)
+
+    def __flush_insert_buffer(self, collect_metrics: bool) -> None:
+        """Flushes the insert buffer, see `flush_insert_buffer`.
 
+        Arguments:
+            collect_metrics {bool} -- whether send-statistics are inserted into the buffer after sending
+
+        Raises:
+            ValueError: Critical: The query Buffer is None.
+        """
         if(self.__insert_buffer is None):
             raise ValueError("query buffer is somehow None, this should never happen!")
         # Only send if there is something to send
         if(not self.__insert_buffer):
             return
+        if(self.__send_executor is None):
+            raise ValueError("client is not connected, call `connect` before flushing the buffer")
 
-        # Done before to be able to clear buffer before sending
+        # Snapshot to be able to remove each table from the buffer before sending
         # therefore stats can be re-inserted
-        insert_list: List[Tuple[Table, List[str]]] = []
-        for(table, queries) in self.__insert_buffer.items():
+        tables = list(self.__insert_buffer.keys())
+
+        # send the tables concurrently, each table in its own batches
+        future_dict: Dict[Future[float], Tuple[Table, int]] = {}
+        for table in tables:
+            queries_str = self.__insert_buffer.pop(table)
+            # nothing to send, e.g. if all dicts of a insert were skipped
+            if(not queries_str):
+                continue
+            future = self.__send_executor.submit(self.__send_insert_batches, table, queries_str)
+            future_dict[future] = (table, len(queries_str))
+
+        # metrics are inserted by this thread only, the buffer is not thread safe
+        for future in as_completed(future_dict):
+            (table, query_count) = future_dict[future]
+            duration_s = future.result()
+            if(not collect_metrics):
+                continue
+            # add metrics for the next sending process.
+            # compute duration, metrics computed per batch
+            self.__insert_metrics_to_buffer(
+                Keyword.INSERT, {table:query_count}, duration_s, query_count)
+
+    def __send_insert_batches(self, table: Table, queries_str: List[str]) -> float:
+        """Sends the querys of a single table to the influxdb, split into batches.
+
+        Arguments:
+            table {Table} -- table the querys are inserted into
+            queries_str {List[str]} -- insert querys as str
 
-            insert_list.append((table, list(map(lambda query: query.to_query(), queries))))
+        Returns:
+            float -- duration of the send process in seconds
+        """
+        # stop time for send progess
+        start_time = time.perf_counter()
+        try:
+            params = {
+                'db': self.database.name,
+                'rp': table.retention_policy.name,
+                'precision': self.time_precision
+            }
+            headers = {
+                'Content-Type': 'application/octet-stream',
+                'Content-Encoding': 'gzip'
+            }
+            # send batches limited by count and size
+            # joined at once instead of the per-point handling of `write_points`
+            for batch in self.__split_into_batches(queries_str):
+                # compressed here, the influx client would always use the slow level 9
+                body = gzip.compress(
+                    ('\n'.join(batch) + '\n').encode('utf-8'),
+                    compresslevel=self.__gzip_compress_level)
+                self.__client.request(
+                    url='write', method='POST', params=params, data=body,
+                    expected_response_code=204, headers=headers)
+        except (InfluxDBServerError, InfluxDBClientError) as error: # type: ignore
+            ExceptionUtils.exception_info(error=error, extra_message="Error when sending Insert Buffer") # type: ignore
+        end_time = time.perf_counter()
 
-        # clear all querys which are now transformed
-        self.__insert_buffer.clear()
+        return end_time-start_time
 
-        for(table, queries_str) in insert_list:
+    def __split_into_batches(self, queries_str: List[str]) -> Iterator[List[str]]:
+        """Splits the querys into batches, each limited by `__query_max_batch_size` and `__query_max_batch_bytes`.
 
-            # stop time for send progess
-            start_time = time.perf_counter()
-            try:
-                # send batch_size querys at once
-                self.__client.write_points(
-                    points=queries_str, database=self.database.name,
-                    retention_policy=table.retention_policy.name,
-                    batch_size=self.__query_max_batch_size,
-                    time_precision='s', protocol='line')
-            except (InfluxDBServerError, InfluxDBClientError) as error: # type: ignore
-                ExceptionUtils.exception_info(error=error, extra_message="Error when sending Insert Buffer") # type: ignore
-            end_time = time.perf_counter()
+        Arguments:
+            queries_str {List[str]} -- querys to be split
 
-            # add metrics for the next sending process.
-            # compute duration, metrics computed per batch
-            self.__insert_metrics_to_buffer(
-                Keyword.INSERT, {table:len(queries_str)}, end_time-start_time, len(queries_str))
+        Yields:
+            List[str] -- batch of querys to be sent at once
+        """
+        batch: List[str] = []
+        batch_bytes = 0
+        for query in queries_str:
+            # size approximated by the str length, +1 due newline seperator
+            query_bytes = len(query) + 1
+            if(batch and (len(batch) >= self.__query_max_batch_size or
+                          batch_bytes + query_bytes > self.__query_max_batch_bytes)):
+                yield batch
+                batch = []
+                batch_bytes = 0
+            batch.append(query)
+            batch_bytes += query_bytes
+        if(batch):
+            yield batch
 
     def __insert_metrics_to_buffer(self, keyword: Keyword, tables_count: Dict[Table, int],
                                    duration_s: float, batch_size: int = 1) -> None:
@@ -499,7 +624,7 @@ class InfluxClient:
             ValueError: Any arg does not match the defined parameters or value is unsupported
         """
         # Arg checks
-        if(list(filter(lambda arg: arg is None, [keyword, tables_count, duration_s, batch_size]))):
+        if(keyword is None or tables_count is None or duration_s is None or batch_size is None):
             raise ValueError("any metric arg is None. This is not supported")
         if(not isinstance(keyword, Keyword)):
             raise ValueError("need the keyword to be a instance of keyword.")
@@ -511,7 +636,8 @@ class InfluxClient:
             raise ValueError("only positive values are supported for batch_size. Must be not 0")
 
         # get shared record time to be saved on
-        querys = []
+        time_stamp = SppUtils.get_actual_time_sec()
+        querys: List[str] = []
 
         # save metrics for each involved table individually
         for (table, item_count) in tables_count.items():
@@ -527,9 +653,9 @@ class InfluxClient:
                         'keyword':      keyword,
                         'tableName':    table.name,
                     },
-                    time_stamp=SppUtils.get_actual_time_sec()
-                ))
-        self.__insert_buffer[self.__metrics_table] = self.__insert_buffer.get(self.__metrics_table, []) + querys
+                    time_stamp=time_stamp
+                ).to_query())
+        self.__insert_buffer.setdefault(self.__metrics_table, []).extend(querys)
 
     def update_row(self, table_name: str, tag_dic: Dict[str, str] = None,
                    field_dic: Dict[str, Union[str, int, float, bool]] = None, where_str: str = None):
@@ -564,11 +690,11 @@ class InfluxClient:
         query = SelectionQuery(
             keyword=keyword, fields=['*'], tables=[table], where_str=where_str)
         result = self.send_selection_query(query) # type: ignore
-        result_list: List[Dict[str, Union[int, float, bool, str]]] = list(result.get_points()) # type: ignore
 
-        # no results found
-        if(not result_list):
+        # no results found, checked before computing all points
+        if(not result or not result.raw.get('series')): # type: ignore
             return
+        result_list: List[Dict[str, Union[int, float, bool, str]]] = list(result.get_points()) # type: ignore
 
         # split between remove and insert
         # if tag are replaced it is needed to remove the old row first
@@ -580,15 +706,8 @@ class InfluxClient:
                 keyword=keyword, tables=[table], where_str=where_str)
             self.send_selection_query(query)
 
-        insert_list = []
-        for row in result_list:
-            if(tag_dic):
-                for (key, value) in tag_dic.items():
-                    row[key] = value
-            if(field_dic):
-                for (key, value) in field_dic.items():
-                    row[key] = value
-            insert_list.append(row)
+        # merge new values into each row, later dicts overwrite
+        insert_list = [{**row, **(tag_dic or {}), **(field_dic or {})} for row in result_list]
 
         # default insert method
         self.insert_dicts_to_buffer(table_name, insert_list)
@@ -622,7 +741,7 @@ class InfluxClient:
         # Send querys
         try:
             result = self.__client.query( # type: ignore
-                query=query_str, epoch='s', database=self.database.name)
+                query=query_str, epoch=self.time_precision, database=self.database.name)
 
         except (InfluxDBServerError, InfluxDBClientError) as err: # type: ignore
             ExceptionUtils.exception_info(error=err, extra_message="error when sending select statement") # type: ignore
@@ -42,6 +42,9 @@ class InsertQuery:
         format_fields - Formats fields accordingly to the requirements of the influxdb.
         format_tags - Formats tags accordingly to the requirements of the influxdb.
     """
+    __slots__ = ('__keyword', '__table', '__time_stamp', '__fields', '__tags')
+    """Avoids a instance dict, a InsertQuery is created for each single insert."""
+
     # those need to be escaped
     __bad_name_characters: List[Tuple[str, str]] = [(r'=', r'\='), (r' ', r'\ '), (r',', r'\,')]
     """Characters which need to be replaced, as tuple list: (old, new). Reference influx wiki."""
@@ -104,15 +107,11 @@ class InsertQuery:
             str -- a full functional insert query as string
         """
         if(self.__tags):
-            tag_str = ',{}'.format(
-                ",".join(map(lambda row: '{key}={value}'.format(key=row[0], value=row[1]),
-                             self.__tags.items())))
+            tag_str = ',' + ",".join([f'{key}={value}' for (key, value) in self.__tags.items()])
         else:
             tag_str = ''
 
-        fields_str = ",".join(
-            map(lambda row: '{key}={value}'.format(key=row[0], value=row[1]),
-                self.__fields.items()))
+        fields_str = ",".join([f'{key}={value}' for (key, value) in self.__fields.items()])
 
         if(self.__time_stamp is not None):
             time_stamp_str = str(self.__time_stamp)
@@ -172,6 +171,7 @@ class InsertQuery:
 
         Cast all values to strings and escapes all characters which are not allowed.
         Applies to both key and value.
+        Tags are sorted by key, saving the influxdb to sort them on each insert.
 
         Arguments:
             tags {Dict[str, Any]} -- Dict of all tags to be formatted, key is name, value is data
@@ -191,7 +191,8 @@ class InsertQuery:
 
             ret_dict[key] = value
 
-        return ret_dict
+        # str order matches the byte-wise order of the utf-8 encoded keys used by influx
+        return dict(sorted(ret_dict.items()))
 
 
 class SelectionQuery:
@@ -6,7 +6,7 @@ Classes:
 """
 import re
 import logging
-from typing import Dict, Tuple, Union, Any, List
+from typing import Dict, Pattern, Tuple, Union, Any, List
 
 from utils.spp_utils import SppUtils
 from utils.execption_utils import ExceptionUtils
@@ -29,6 +29,9 @@ class InfluxUtils:
     time_key_names: List[str] = ['time', SppUtils.capture_time_key, "logTime"]
     """default time_key names."""
 
+    __escape_patterns: Dict[str, Pattern[str]] = {}
+    """Compiled escape pattern per char, used by `escape_chars` for each single insert."""
+
     @staticmethod
     def check_time_literal(value: str) -> bool:
         """Checks wheather the str is consistend as influxdb time literal
@@ -93,12 +96,14 @@ class InfluxUtils:
         return f"{hours}h{mins}m{seconds}s"
 
 
-    @staticmethod
-    def escape_chars(value: Any, replace_list: List[Tuple[str, str]]) -> str:
+    @classmethod
+    def escape_chars(cls, value: Any, replace_list: List[Tuple[str, str]]) -> str:
         """Escapes chars to a even number of escape signs. Only adds escape signs.
 
         TODO: Probably buggy with filenames, need to redo again.
 
+        The chars are matched literally, compiled patterns are cached.
+
         Arguments:
             value {str} -- string which should get escaped
 
@@ -119,8 +124,14 @@ class InfluxUtils:
         value = '{}'.format(value)
 
         for(old, new) in replace_list:
-            pattern = re.compile(r'((?<!\\{1})(?:\\{2})*)' + old)
-            value = re.sub(pattern, r'\1'+new, value)
+            # most values contain none of the chars, skip the regex then
+            if(old not in value):
+                continue
+            pattern = cls.__escape_patterns.get(old, None)
+            if(pattern is None):
+                pattern = re.compile(r'((?<!\\{1})(?:\\{2})*)' + old)
+                cls.__escape_patterns[old] = pattern
+            value = pattern.sub(r'\1'+new, value)
 
         return value
 